@@ -1,24 +1,206 @@
+import logging
+import sys
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, font as tkfont
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import accumulate
+
+# Initial memory layout as (size in KB, is_allocated, process ID)
+_INITIAL_LAYOUT = (
+    (2, False, ""),
+    (120, True, "Process-A"),
+    (20, False, ""),
+    (150, True, "Process-B"),
+    (160, True, "Process-C"),
+    (1, False, ""),
+    (4, False, ""),
+    (554, True, "Process-D"),
+    (124, False, ""),
+)
+
+# Lines kept in the event log; the oldest are dropped beyond this
+_LOG_MAX_LINES = 500
+
+logger = logging.getLogger(__name__)
+
+# Sections of the info window, one per allocation algorithm
+_ALGORITHM_SECTIONS = [
+    {
+        "title": "1. First Fit",
+        "rows": [
+            ("Process:", "Start searching from the beginning of the memory."),
+            (
+                "Action:",
+                "Allocate the requested memory from the first free block encountered that is "
+                "equal to or larger than the requested size.",
+            ),
+            (
+                "Remaining Space:",
+                "If the allocated block is larger than the request, the remaining portion "
+                "is left as a new free block.",
+            ),
+        ],
+    },
+    {
+        "title": "2. Next Fit",
+        "rows": [
+            (
+                "Process:",
+                "Start searching from the location where the previous allocation search finished.",
+            ),
+            (
+                "Action:",
+                "Allocate the requested memory from the first free block encountered from that "
+                "point onwards that is equal to or larger than the requested size.",
+            ),
+            (
+                "Remaining Space:",
+                "Similar to First Fit, the remaining space becomes a new free block.",
+            ),
+            (
+                "Benefit:",
+                "It tends to distribute memory blocks more evenly throughout the memory.",
+            ),
+        ],
+    },
+    {
+        "title": "3. Best Fit",
+        "rows": [
+            ("Process:", "Scan the entire list of free blocks."),
+            (
+                "Action:",
+                "Allocate the requested memory from the free block that is the smallest "
+                "among all blocks that can satisfy the request.",
+            ),
+            ("Remaining Space:", "The remaining space is left as a new free block."),
+            (
+                "Goal:",
+                "To minimize the wasted space (internal fragmentation) within the allocated block.",
+            ),
+        ],
+    },
+    {
+        "title": "4. Worst Fit",
+        "rows": [
+            ("Process:", "Scan the entire list of free blocks."),
+            (
+                "Action:",
+                "Allocate the requested memory from the free block that is the largest "
+                "among all blocks that can satisfy the request.",
+            ),
+            ("Remaining Space:", "The remaining space is left as a new free block."),
+            (
+                "Goal:",
+                "To leave the largest possible remaining free block, hoping it will be useful "
+                "for future larger requests.",
+            ),
+        ],
+    },
+]
+
+# Static paragraphs of the info window, built once at import
+_HELP_INTRO = (
+    "Memory allocation is a fundamental process in operating systems and programming languages where "
+    "processes or programs are assigned space in memory. Efficient memory allocation is crucial for "
+    "system performance and stability. Various algorithms exist to manage this task, each with its "
+    "own advantages and disadvantages."
+)
+
+_HELP_JUSTIFICATION = (
+    "While different algorithms have their merits, First Fit is often considered a practical and "
+    "efficient choice for memory allocation due to several factors:"
+)
+
+_HELP_BLOCKS_EXAMPLE = "Consider a scenario with the following memory blocks of varying sizes:"
+
+_HELP_BLOCK_BULLETS = "".join(
+    f"\u2022 {block}\n"
+    for block in (
+        "Block 1: 100 KB",
+        "Block 2: 500 KB",
+        "Block 3: 200 KB",
+        "Block 4: 300 KB",
+        "Block 5: 600 KB",
+    )
+)
+
+_HELP_COMPARISON = (
+    "Let's say we have a request for 250 KB.\n\n"
+    "First Fit: It would scan from Block 1. Block 1 (100 KB) is too small. Block 2 (500 KB) is large enough. "
+    "First Fit allocates 250 KB from Block 2, leaving a 250 KB free block.\n\n"
+    "Best Fit: It would scan all blocks. Block 2 (500 KB), Block 4 (300 KB), and Block 5 (600 KB) are large enough. "
+    "Best Fit would choose Block 4 (300 KB) as it's the smallest sufficient block, allocating 250 KB and leaving a 50 KB free block.\n\n"
+    "Worst Fit: It would choose Block 5 (600 KB) as it's the largest, allocating 250 KB and leaving a 350 KB free block.\n\n"
+    "In this simple example, First Fit quickly finds a suitable block without scanning the entire memory, which can be faster."
+)
+
+_HELP_ALLOC = (
+    "Simulating a series of allocation and deallocation requests highlights First Fit's efficiency. "
+    "First Fit's speed comes from its straightforward approach: it stops searching as soon as a suitable "
+    "block is found. This is particularly beneficial when the memory has many free blocks at the beginning. "
+    "While Best Fit and Worst Fit need to scan more or all of the free list, First Fit's search time is, "
+    "on average, less.\n\n"
+    "Deallocation in First Fit is also relatively simple; the deallocated block is typically merged with "
+    "adjacent free blocks if they exist."
+)
+
+_HELP_FRAG_INTRO = "Fragmentation is a key issue in memory allocation."
+
+_HELP_FRAG_INT = (
+    "Occurs when the allocated memory block is larger than the requested size, and the excess "
+    "space within the block cannot be used by other processes. Best Fit aims to minimize this, "
+    "but First Fit can also result in internal fragmentation when a larger block is used for a smaller request."
+)
+
+_HELP_FRAG_EXT = (
+    "Occurs when there is enough total free space to satisfy a request, but the free space is "
+    "scattered in small, non-contiguous blocks. All simple contiguous allocation algorithms like "
+    "First Fit, Best Fit, and Worst Fit are susceptible to external fragmentation over time."
+)
+
+_HELP_FRAG_SUMMARY = (
+    "First Fit's handling of fragmentation is a trade-off. While it might lead to more external "
+    "fragmentation over time compared to Best Fit (as it tends to use up smaller blocks at the beginning, "
+    "leaving larger blocks fragmented later), its speed often compensates for this in many practical "
+    "scenarios. The tendency of First Fit to use blocks at the beginning can also lead to larger free "
+    "blocks accumulating towards the end of memory, which can be beneficial for larger future requests."
+)
+
+_HELP_SUMMARY = (
+    "First Fit is often preferred in practice due to its speed of allocation. It requires less overhead "
+    "for searching compared to Best Fit and Worst Fit, which must scan more or all of the free list. "
+    "While it may not be optimal in terms of minimizing internal fragmentation or preventing external "
+    "fragmentation entirely, its simplicity and speed make it a good general-purpose algorithm, "
+    'especially in systems where allocation speed is critical. The overhead of searching for the "best" '
+    'or "worst" fit can outweigh the potential benefits in terms of fragmentation in many real-world scenarios.'
+)
 
 # Structure to represent a memory block
 class MemoryBlock:
+    __slots__ = (
+        "start_address",
+        "size",
+        "allocated",
+        "process_id",
+        "prev",
+        "next",
+        "prev_free",
+        "next_free",
+    )
+
     def __init__(self, start_address: int, block_size: int, is_allocated=False, pid=""):
         self.start_address = start_address
         self.size = block_size
         self.allocated = is_allocated
         self.process_id = pid
-
-    def __eq__(self, other):
-        if not isinstance(other, MemoryBlock):
-            return False
-        return (
-            self.start_address == other.start_address
-            and self.size == other.size
-            and self.allocated == other.allocated
-            and self.process_id == other.process_id
-        )
+        # Neighbours in address order; memory is a doubly-linked list of blocks
+        self.prev = None
+        self.next = None
+        # Neighbours in the address-ordered chain of free blocks only
+        self.prev_free = None
+        self.next_free = None
 
     def __str__(self):
         status = f"Allocated ({self.process_id})" if self.allocated else "Free"
@@ -26,49 +208,113 @@ class MemoryBlock:
 
 
 class MemoryAllocator:
-    memory: list[MemoryBlock]
+    head: MemoryBlock
+    free_lists: dict[int, deque[MemoryBlock]]
+    pid_to_blocks: dict[str, list[MemoryBlock]]
     total_memory_size: int
     used_memory: int
+    largest_free_size: int
+    has_adjacent_free: bool
 
     def __init__(self):
-        self.memory = []
+        self.head = MemoryBlock(0, 0, True)
+        self.free_lists = {}
+        self.pid_to_blocks = {}
         self.total_memory_size = 0
         self.used_memory = 0
+        self.largest_free_size = 0
+        self.has_adjacent_free = False
         self.initialize_memory()
 
     def initialize_memory(self):
         """Resets memory to its initial predefined state."""
-        self.memory = []
+        # Sentinel before the first block; marked allocated so it is never merged.
+        # It also heads the address-ordered chain of free blocks.
+        self.head = MemoryBlock(0, 0, True)
+        self.free_lists = {}
+        self.pid_to_blocks = {}
         self.total_memory_size = 0
         self.used_memory = 0
-        current_address = 0
-
-        initial_layout = [
-            (2, False, ""),
-            (120, True, "Process-A"),
-            (20, False, ""),
-            (150, True, "Process-B"),
-            (160, True, "Process-C"),
-            (1, False, ""),
-            (4, False, ""),
-            (554, True, "Process-D"),
-            (124, False, ""),
-        ]
+        self.largest_free_size = 0
+        # Frees only coalesce their own neighbours, so free runs present from
+        # the start are merged by one full pass on the first deallocation
+        self.has_adjacent_free = False
+
+        sizes = [size for size, _, _ in _INITIAL_LAYOUT]
+        start_addresses = accumulate(sizes, initial=0)
 
-        for size, allocated, pid in initial_layout:
-            self.memory.append(MemoryBlock(current_address, size, allocated, pid))
+        tail = free_tail = self.head
+        for start_address, (size, allocated, pid) in zip(
+            start_addresses, _INITIAL_LAYOUT
+        ):
+            block = MemoryBlock(start_address, size, allocated, sys.intern(pid))
+            if not allocated and not tail.allocated:
+                self.has_adjacent_free = True
+            self.insert_block_after(tail, block)
+            tail = block
             if allocated:
-                self.used_memory += size
-            current_address += size
+                self.pid_to_blocks.setdefault(block.process_id, []).append(block)
+            else:
+                self.insert_free_after(free_tail, block)
+                free_tail = block
+                self.add_free_block(block)
 
-        self.total_memory_size = current_address
-        print(
-            f"Memory Initialized: Total={self.total_memory_size}, Used={self.used_memory}"
+        self.total_memory_size = sum(sizes)
+        self.used_memory = sum(
+            size for size, allocated, _ in _INITIAL_LAYOUT if allocated
+        )
+        logger.debug(
+            "Memory Initialized: Total=%d, Used=%d",
+            self.total_memory_size,
+            self.used_memory,
         )
 
     def get_memory_blocks(self) -> list[MemoryBlock]:
-        """Returns the current list of memory blocks."""
-        return self.memory
+        """Returns a list of the current memory blocks in address order."""
+        blocks = []
+        block = self.head.next
+        while block is not None:
+            blocks.append(block)
+            block = block.next
+        return blocks
+
+    def insert_block_after(self, block: MemoryBlock, new_block: MemoryBlock):
+        """Links new_block into memory directly after block."""
+        new_block.prev = block
+        new_block.next = block.next
+        if block.next is not None:
+            block.next.prev = new_block
+        block.next = new_block
+
+    def unlink_block(self, block: MemoryBlock):
+        """Removes a block from memory; the sentinel head guarantees it has a prev."""
+        block.prev.next = block.next
+        if block.next is not None:
+            block.next.prev = block.prev
+        block.prev = block.next = None
+
+    def insert_free_after(self, free_block: MemoryBlock, block: MemoryBlock):
+        """Links block into the free chain directly after free_block."""
+        block.prev_free = free_block
+        block.next_free = free_block.next_free
+        if free_block.next_free is not None:
+            free_block.next_free.prev_free = block
+        free_block.next_free = block
+
+    def link_free_block(self, block: MemoryBlock):
+        """Links a newly freed block into the free chain at its address position."""
+        # The nearest free block to the left (or the head) is its predecessor
+        previous = block.prev
+        while previous is not self.head and previous.allocated:
+            previous = previous.prev
+        self.insert_free_after(previous, block)
+
+    def unlink_free_block(self, block: MemoryBlock):
+        """Removes a block from the free chain; the head guarantees it has a prev_free."""
+        block.prev_free.next_free = block.next_free
+        if block.next_free is not None:
+            block.next_free.prev_free = block.prev_free
+        block.prev_free = block.next_free = None
 
     def get_memory_stats(self) -> tuple[int, int, int, float]:
         """Returns total size, used size, free size, and fragmentation %."""
@@ -90,126 +336,182 @@ class MemoryAllocator:
         if self.process_exists(process_id):
             return False, "duplicate_process"
 
-        allocated = False
-        for i, block in enumerate(self.memory):
-            if not block.allocated and block.size >= size:
-                self.allocate_block(i, size, process_id)
-                allocated = True
-                break
+        block = self.find_free_block(size)
+        if block is None:
+            return False, "allocation_error"
+
+        self.allocate_block(block, size, process_id)
+        return True, "success"
 
-        if allocated:
-            return True, "success"
+    def find_free_block(self, size: int) -> MemoryBlock | None:
+        """
+        Returns the lowest-addressed free block of at least `size` (First-Fit).
+        Walks the address-ordered free chain, so allocated blocks are never
+        visited and the walk stops at the first block that fits.
+        """
+        if size > self.largest_free_size:
+            return None  # Nothing can fit; skip the walk
+        block = self.head.next_free
+        while block is not None:
+            if block.size >= size:
+                return block
+            block = block.next_free
+        return None
+
+    def add_free_block(self, block: MemoryBlock, recently_freed=False):
+        """Files a free block under its power-of-two size class."""
+        bucket = self.free_lists.setdefault(block.size.bit_length(), deque())
+        if recently_freed:
+            bucket.appendleft(block)  # Most-recently-freed blocks go first
         else:
-            return False, "allocation_error"
+            bucket.append(block)
+        if block.size > self.largest_free_size:
+            self.largest_free_size = block.size
+
+    def remove_free_block(self, block: MemoryBlock):
+        """Takes a block out of its size class. Must be called before its size changes."""
+        size_class = block.size.bit_length()
+        bucket = self.free_lists[size_class]
+        bucket.remove(block)
+        if not bucket:
+            del self.free_lists[size_class]
+
+    def find_largest_free_size(self) -> int:
+        """Returns the largest free block size by scanning the highest non-empty size class."""
+        if not self.free_lists:
+            return 0
+        return max(block.size for block in self.free_lists[max(self.free_lists)])
 
     def process_exists(self, process_id: str) -> bool:
         """Checks if a process ID is already allocated in memory."""
-        for block in self.memory:
-            if block.allocated and block.process_id == process_id:
-                return True
-        return False
-
-    def allocate_block(self, block_idx: int, size: int, process_id: str):
-        """Internal helper to allocate within a specific block, splitting if necessary."""
-        block = self.memory[block_idx]
-        original_block_size = block.size
-
-        if block.size == size:
-            # If the block is exactly the size we need
-            block.allocated = True
-            block.process_id = process_id
-            print(f"Allocated exact block {block_idx} ({size}KB) to {process_id}")
-        elif block.size > size:
+        return process_id in self.pid_to_blocks
+
+    def allocate_block(self, block: MemoryBlock, size: int, process_id: str):
+        """
+        Internal helper to allocate within a specific block, splitting if necessary.
+        The caller guarantees the block is free and at least `size` KB.
+        """
+        was_largest_free = block.size == self.largest_free_size
+        # Interned IDs let later comparisons and dict lookups short-circuit on identity
+        process_id = sys.intern(process_id)
+
+        self.remove_free_block(block)
+        block.allocated = True
+        block.process_id = process_id
+
+        if block.size > size:
             # If the block is larger, split it
             remaining_size = block.size - size
             block.size = size
-            block.allocated = True
-            block.process_id = process_id
 
             # Create a new block for the remaining space
             new_free_block = MemoryBlock(
                 block.start_address + size, remaining_size, False, ""
             )
-            self.memory.insert(block_idx + 1, new_free_block)
-            print(
-                f"Split block {block_idx} ({original_block_size}KB): allocated {size}KB to {process_id}, remaining {remaining_size}KB free."
+            self.insert_block_after(block, new_free_block)
+            # The remainder takes the block's place in the free chain
+            self.insert_free_after(block, new_free_block)
+            self.unlink_free_block(block)
+            self.add_free_block(new_free_block)
+            logger.debug(
+                "Split block at %d: allocated %dKB to %s, remaining %dKB free.",
+                block.start_address,
+                size,
+                process_id,
+                remaining_size,
             )
         else:
-            print(
-                f"Error: Tried to allocate {size}KB in block {block_idx} with size {block.size}KB"
+            # The block is exactly the size we need
+            self.unlink_free_block(block)
+            logger.debug(
+                "Allocated exact block at %d (%dKB) to %s",
+                block.start_address,
+                size,
+                process_id,
             )
-            return
 
         self.used_memory += size
+        self.pid_to_blocks.setdefault(process_id, []).append(block)
+        if was_largest_free:
+            # Only re-derive the cached maximum when its block was consumed
+            self.largest_free_size = self.find_largest_free_size()
 
     def deallocate_memory(self, process_id: str) -> bool:
         """Deallocates all memory blocks assigned to a specific process ID."""
-        found = False
+        blocks = self.pid_to_blocks.pop(process_id, None)
+        if blocks is None:
+            return False
+
         deallocated_size = 0
-        indices_to_check_merge = set()
-
-        # Iterate backwards to handle potential merging correctly after removals if needed
-        # (Although we don't remove, just mark free, iterating forward is fine here)
-        for i, block in enumerate(self.memory):
-            if block.allocated and block.process_id == process_id:
-                print(f"Deallocating block {i} (Size: {block.size}KB) for {process_id}")
-                deallocated_size += block.size
-                block.allocated = False
-                block.process_id = ""
-                found = True
-                # Record indices near the freed block for potential merging
-                if i > 0:
-                    indices_to_check_merge.add(i - 1)
-                indices_to_check_merge.add(
-                    i
-                )  # Check the freed block itself with its right neighbor
-
-        if found:
-            self.used_memory -= deallocated_size
-            print(
-                f"Total deallocated: {deallocated_size}KB. Used memory now: {self.used_memory}"
+        for block in blocks:
+            logger.debug(
+                "Deallocating block at %d (Size: %dKB) for %s",
+                block.start_address,
+                block.size,
+                process_id,
             )
-            self.merge_adjacent_free_blocks(
-                indices_to_check_merge
-            )  # Pass relevant indices
-            return True
-
-        return False
-
-    def merge_adjacent_free_blocks(
-        self, indices_to_start_check: set[int] | None = None
-    ):
-        """Merges adjacent free blocks. Can be optimized to check only around recent changes."""
+            deallocated_size += block.size
+            block.allocated = False
+            block.process_id = ""
+            self.link_free_block(block)
+            self.add_free_block(block, recently_freed=True)
+            self.coalesce_free_block(block)
+
+        self.used_memory -= deallocated_size
+        logger.debug(
+            "Total deallocated: %dKB. Used memory now: %d",
+            deallocated_size,
+            self.used_memory,
+        )
+        if self.has_adjacent_free:
+            self.merge_adjacent_free_blocks()
+            self.has_adjacent_free = False
+        return True
+
+    def coalesce_free_block(self, block: MemoryBlock):
+        """Merges a newly freed block with whichever of its two neighbours are free."""
+        neighbour = block.next
+        if neighbour is not None and not neighbour.allocated:
+            self.merge_free_pair(block, neighbour)
+        # The sentinel head is marked allocated, so prev is never merged into it
+        if not block.prev.allocated:
+            self.merge_free_pair(block.prev, block)
+
+    def merge_free_pair(self, block: MemoryBlock, neighbour: MemoryBlock):
+        """Folds a free block into its free left neighbour by unlinking it."""
+        logger.debug(
+            "Merging free blocks at %d (%dKB) and %d (%dKB)",
+            block.start_address,
+            block.size,
+            neighbour.start_address,
+            neighbour.size,
+        )
+        self.remove_free_block(block)
+        self.remove_free_block(neighbour)
+        block.size += neighbour.size
+        self.add_free_block(block, recently_freed=True)
+        self.unlink_block(neighbour)
+        self.unlink_free_block(neighbour)
+
+    def merge_adjacent_free_blocks(self):
+        """Merges every run of adjacent free blocks in a single pass over memory."""
         merged = False
-        i = 0
-        while i < len(self.memory) - 1:
-            # Only perform merge check if blocks at i and i+1 are free
-            if not self.memory[i].allocated and not self.memory[i + 1].allocated:
-                print(
-                    f"Merging free blocks at index {i} ({self.memory[i].size}KB) and {i+1} ({self.memory[i+1].size}KB)"
-                )
-                # Merge block i+1 into block i
-                self.memory[i].size += self.memory[i + 1].size
-                # Remove block i+1
-                self.memory.pop(i + 1)
+        block = self.head.next
+        while block is not None and block.next is not None:
+            neighbour = block.next
+            if not block.allocated and not neighbour.allocated:
+                self.merge_free_pair(block, neighbour)
                 merged = True
-                # Don't increment i, as the new block at i might need merging with the next one
-                continue  # Re-evaluate the current index i
-            i += 1
+                continue  # The grown block might need merging with its new neighbour
+            block = neighbour
 
         if merged:
-            print("Finished merging adjacent free blocks.")
-            # for block in self.memory: print(f"  {block}") # Optional: print state after merge
+            logger.debug("Finished merging adjacent free blocks.")
 
     def calculate_fragmentation(self) -> float:
         """Calculates external fragmentation percentage."""
         total_free_memory = self.total_memory_size - self.used_memory
-        largest_free_block = 0
-
-        for block in self.memory:
-            if not block.allocated:
-                if block.size > largest_free_block:
-                    largest_free_block = block.size
+        largest_free_block = self.largest_free_size
 
         # If there's no free memory, or only one free block (which is the largest)
         if total_free_memory == 0:
@@ -231,92 +533,119 @@ class MemoryAllocator:
 class MemoryVisualPanel(tk.Canvas):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.memory_blocks = []
+        # Parallel per-block columns, snapshotted whenever memory changes
+        self.total_size = 0
+        self.block_sizes = []
+        self.block_allocated = []
+        self.block_labels = []
+        # Canvas items are kept and repositioned rather than recreated on redraw
+        self._rect_ids = []
+        self._text_ids = []
+        self._text_shown = []
+        self._restyle_pending = False
+        # Size from the last <Configure>, so redraws need no winfo_* round-trips
+        self._width = 0
+        self._height = 0
         self.configure(bg="white", height=100, bd=1, relief="sunken")
         self.bind("<Configure>", self.on_resize)
 
-    def update_memory_blocks(self, blocks: list[MemoryBlock]):
-        """Stores the latest memory blocks and triggers a redraw."""
-        self.memory_blocks = blocks
+    def update_memory_blocks(self, blocks: list[MemoryBlock], total_size: int):
+        """Stores the latest memory blocks and their combined size, then redraws."""
+        self.total_size = total_size
+        self.block_sizes = [block.size for block in blocks]
+        self.block_allocated = [block.allocated for block in blocks]
+        self.block_labels = [
+            block.process_id if block.allocated else "(Free)" for block in blocks
+        ]
+        self._restyle_pending = True
         self.redraw()
 
     def on_resize(self, event=None):
         """Callback function when the canvas is resized."""
+        if event is not None:
+            if event.width == self._width and event.height == self._height:
+                return  # Moved or restacked only; the layout is unchanged
+            self._width = event.width
+            self._height = event.height
         self.redraw()
 
-    def redraw(self):
-        """Clears and redraws the memory blocks on the canvas."""
-        self.delete("all")
+    def sync_item_count(self, count: int):
+        """Creates or deletes canvas items so there is one rectangle and text per block."""
+        while len(self._rect_ids) < count:
+            self._rect_ids.append(
+                self.create_rectangle(0, 0, 0, 0, outline="black", width=1)
+            )
+            self._text_ids.append(
+                self.create_text(
+                    0, 0, anchor="center", font=("Helvetica", 8), state="hidden"
+                )  # Smaller font
+            )
+            self._text_shown.append(False)
 
-        if not self.memory_blocks:
-            return
+        if len(self._rect_ids) > count:
+            self.delete(*self._rect_ids[count:], *self._text_ids[count:])
+            del self._rect_ids[count:]
+            del self._text_ids[count:]
+            del self._text_shown[count:]
 
-        # Calculate total memory size for scaling
-        total_size = sum(block.size for block in self.memory_blocks)
-        if total_size == 0:  # Avoid division by zero if memory is empty
+    def redraw(self):
+        """Repositions (and restyles if memory changed) the block items on the canvas."""
+        total_size = self.total_size
+        if total_size == 0:  # Nothing to draw, or avoid division by zero
+            self.sync_item_count(0)
             return
 
-        canvas_width = self.winfo_width()
-        canvas_height = self.winfo_height()
+        canvas_width = self._width
+        canvas_height = self._height
 
         if canvas_width <= 1 or canvas_height <= 1:  # Canvas not yet properly sized
             return
 
-        # Draw memory blocks
-        current_x = 0
-        for block in self.memory_blocks:
-            block_width = max(2, (block.size / total_size) * canvas_width)
-
-            end_x = current_x + block_width
+        # Compute all block geometry up front, then only issue Tk calls below
+        # Integer edges from cumulative sizes, so rounding never drifts and the
+        # last block ends exactly at the right edge; every block gets >= 1 pixel
+        ends = []
+        end_x = 0
+        for cumulative_size in accumulate(self.block_sizes):
+            end_x = max(end_x + 1, cumulative_size * canvas_width // total_size)
+            ends.append(end_x)
+        widths = [end - start for start, end in zip([0, *ends], ends)]
+
+        # Only show text if the block is wide enough
+        # Estimate text width roughly (very approximate)
+        font_size = 8
+        char_width = font_size * 0.6
+        show_text = [
+            canvas_height > 20
+            and width > max(len(str(size)) + 1, len(label)) * char_width + 4
+            for size, label, width in zip(self.block_sizes, self.block_labels, widths)
+        ]
 
-            if block.allocated:
-                color = "#7d9b68"
-            else:
-                color = "#dcdcdc"
+        self.sync_item_count(len(self.block_sizes))
+        # Fills and labels only change with memory, not with the canvas size
+        restyle = self._restyle_pending
+        self._restyle_pending = False
 
-            # Draw the rectangle
-            self.create_rectangle(
-                current_x, 0, end_x, canvas_height, fill=color, outline="black", width=1
-            )
+        current_x = 0
+        for i, (rect_id, text_id, end_x, has_text) in enumerate(
+            zip(self._rect_ids, self._text_ids, ends, show_text)
+        ):
+            self.coords(rect_id, current_x, 0, end_x, canvas_height)
+            if restyle:
+                color = "#7d9b68" if self.block_allocated[i] else "#dcdcdc"
+                self.itemconfig(rect_id, fill=color)
+                self.itemconfig(
+                    text_id, text=f"{self.block_sizes[i]}K\n{self.block_labels[i]}"
+                )
 
-            # --- Draw Text ---
-            if block.allocated:
-                text_label = f"{block.size}K\n{block.process_id}"
-            else:
-                text_label = f"{block.size}K\n(Free)"
-
-            # Only draw text if the block is wide enough
-            # Estimate text width roughly (very approximate)
-            font_size = 8
-            estimated_text_width = max(
-                len(str(block.size)) + 1,
-                len(block.process_id if block.allocated else "(Free)"),
-            ) * (font_size * 0.6)
-
-            if block_width > estimated_text_width + 4 and canvas_height > 20:
-                text_x = current_x + block_width / 2
-                text_y = canvas_height / 2
-                self.create_text(
-                    text_x,
-                    text_y,
-                    text=text_label,
-                    anchor="center",
-                    font=("Helvetica", font_size),
-                )  # Smaller font
+            if has_text:
+                self.coords(text_id, (current_x + end_x) / 2, canvas_height / 2)
+            if has_text != self._text_shown[i]:
+                self.itemconfig(text_id, state="normal" if has_text else "hidden")
+                self._text_shown[i] = has_text
 
             current_x = end_x
 
-        # Ensure the last block reaches the edge if rounding caused gaps
-        if current_x < canvas_width:
-            self.create_rectangle(
-                current_x,
-                0,
-                canvas_width,
-                canvas_height,
-                fill="#EEEEEE",
-                outline="black",
-            )  # Fill gap
-
 
 class MemoryAllocatorApp:
     def __init__(self, root: tk.Tk):
@@ -325,12 +654,25 @@ class MemoryAllocatorApp:
         self.root.geometry("900x750")
 
         self.allocator = MemoryAllocator()
+        self._refresh_pending = False
+        self._display_stale = False
+        # Lines beyond the cap would be trimmed on flush anyway, so never hold them
+        self._pending_log_lines = deque(maxlen=_LOG_MAX_LINES)
+        # Resets run off the Tk thread so the event loop stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._reset_future = None
+        # Built on first open, then hidden and re-shown instead of rebuilt
+        self._info_window = None
+        self._info_open = False
 
         # Configure the grid layout
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(5, weight=1)  # Make memory grid row expandable
         self.root.grid_rowconfigure(6, weight=1)  # Make log text area row expandable
 
+        # Named font resolved once by Tk and shared by the info window's bold text
+        self._bold11 = tkfont.Font(family="Arial", size=11, weight="bold")
+
         self.create_menubar()
         self.create_heading()
         self.create_visualization_frame()
@@ -395,10 +737,10 @@ class MemoryAllocatorApp:
         self.process_id_entry.insert(0, "Process-E")
         self.process_id_entry.grid(row=0, column=3, padx=(0, 5), pady=5, sticky="w")
 
-        allocate_button = ttk.Button(
+        self.allocate_button = ttk.Button(
             allocation_frame, text="Allocate Memory", command=self.on_allocate_memory
         )
-        allocate_button.grid(row=0, column=4, padx=(10, 5), pady=5, sticky="w")
+        self.allocate_button.grid(row=0, column=4, padx=(10, 5), pady=5, sticky="w")
 
     def create_deallocation_frame(self):
         deallocation_frame = ttk.LabelFrame(
@@ -422,19 +764,19 @@ class MemoryAllocatorApp:
         self.deallocate_id_entry.insert(0, "Process-A")
         self.deallocate_id_entry.grid(row=0, column=1, padx=(0, 5), pady=5, sticky="w")
 
-        deallocate_button = ttk.Button(
+        self.deallocate_button = ttk.Button(
             deallocation_frame,
             text="Deallocate Memory",
             command=self.on_deallocate_memory,
         )
-        deallocate_button.grid(row=0, column=2, padx=(10, 5), pady=5, sticky="w")
+        self.deallocate_button.grid(row=0, column=2, padx=(10, 5), pady=5, sticky="w")
 
         # --- New Reset Button ---
         # Placed in column 4, after the expanding column 3
-        reset_button = ttk.Button(
+        self.reset_button = ttk.Button(
             deallocation_frame, text="Reset Memory", command=self.on_reset_memory
         )
-        reset_button.grid(row=0, column=4, padx=5, pady=5, sticky="e")
+        self.reset_button.grid(row=0, column=4, padx=5, pady=5, sticky="e")
 
     def create_stats_frame(self):
         stats_frame = ttk.LabelFrame(self.root, text="Memory Statistics")
@@ -475,6 +817,8 @@ class MemoryAllocatorApp:
         self.memory_tree = ttk.Treeview(
             grid_frame, columns=columns, show="headings", height=7
         )
+        # Row contents from the last refresh, keyed by item ID
+        self._last_blocks_snapshot = {}
 
         # Define headings
         self.memory_tree.heading("address", text="Start Addr", anchor="w")
@@ -488,6 +832,10 @@ class MemoryAllocatorApp:
         self.memory_tree.column("status", width=100, stretch=tk.NO, anchor="w")
         self.memory_tree.column("process_id", width=150, stretch=tk.YES, anchor="w")
 
+        # Configure tags for coloring rows by allocation status
+        self.memory_tree.tag_configure("allocated", background="#FFD2D2")  # Lighter red
+        self.memory_tree.tag_configure("free", background="#D2FFD2")  # Lighter green
+
         # Create scrollbar
         scrollbar = ttk.Scrollbar(
             grid_frame, orient=tk.VERTICAL, command=self.memory_tree.yview
@@ -518,37 +866,46 @@ class MemoryAllocatorApp:
         blocks = self.allocator.get_memory_blocks()
 
         # Update memory visualization
-        self.visual_panel.update_memory_blocks(blocks)
+        self.visual_panel.update_memory_blocks(
+            blocks, self.allocator.total_memory_size
+        )
 
         # Update memory tree
-        # Clear existing items
-        for item in self.memory_tree.get_children():
-            self.memory_tree.delete(item)
-
-        # Add memory blocks
-        for i, block in enumerate(blocks):
-            status = "Allocated" if block.allocated else "Free"
-            process_id = block.process_id if block.allocated else "---"
-
-            item_id = self.memory_tree.insert(
-                "",
-                "end",
-                iid=f"block_{i}",
-                values=(
+        # Rows are keyed by start address, which is unique and stable across refreshes
+        # All rows are formatted up front so the loop below only makes Tk calls
+        snapshot = {
+            f"block_{block.start_address}": (
+                (
                     f"{block.start_address:06X}",  # Display address in Hex
-                    f"{block.size}",
-                    status,
-                    process_id,
+                    str(block.size),
+                    "Allocated" if block.allocated else "Free",
+                    block.process_id if block.allocated else "---",
                 ),
+                # Color the row based on allocation status using tags
+                "allocated" if block.allocated else "free",
             )
+            for block in blocks
+        }
+
+        # Only touch the rows that differ from the previous refresh
+        removed = [iid for iid in self._last_blocks_snapshot if iid not in snapshot]
+        if removed:
+            self.memory_tree.delete(*removed)
+
+        for index, (iid, row) in enumerate(snapshot.items()):
+            previous_row = self._last_blocks_snapshot.get(iid)
+            if previous_row == row:
+                continue
+            values, tag = row
+            if previous_row is None:
+                # Surviving rows stay in address order, so index places new rows correctly
+                self.memory_tree.insert(
+                    "", index, iid=iid, values=values, tags=(tag,)
+                )
+            else:
+                self.memory_tree.item(iid, values=values, tags=(tag,))
 
-            # Color the row based on allocation status using tags
-            tag = "allocated" if block.allocated else "free"
-            self.memory_tree.item(item_id, tags=(tag,))
-
-        # Configure tags for coloring (do this once or ensure it's reapplied if needed)
-        self.memory_tree.tag_configure("allocated", background="#FFD2D2")  # Lighter red
-        self.memory_tree.tag_configure("free", background="#D2FFD2")  # Lighter green
+        self._last_blocks_snapshot = snapshot
 
         # Update memory stats
         total, used, free, fragmentation = self.allocator.get_memory_stats()
@@ -560,13 +917,50 @@ class MemoryAllocatorApp:
         self.free_memory_label.config(text=f"Free: {free} KB ({free_percent:.2f}%)")
         self.fragmentation_label.config(text=f"Frag: {fragmentation:.2f}%")
 
+    def _schedule_refresh(self, display=True):
+        """Queues a single refresh for when Tk is next idle."""
+        if display:
+            self._display_stale = True
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Runs the queued refresh, coalescing any requests made since scheduling."""
+        self._refresh_pending = False
+        # While a reset is running the allocator is mid-rebuild; _poll_reset refreshes after
+        if self._display_stale and self._reset_future is None:
+            self._display_stale = False
+            self.update_display()
+        self._flush_log()
+
     def log_message(self, message: str):
-        """Adds a timestamped message to the log area."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
+        """Queues a timestamped message for the log area."""
+        now = datetime.now()
+        # Include milliseconds
+        timestamp = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}.{now.microsecond // 1000:03d}"
+        self._pending_log_lines.append(f"{timestamp} - {message}")
+        self._schedule_refresh(display=False)
+
+    def _flush_log(self):
+        """Writes all queued log lines to the log area with a single insert."""
+        if not self._pending_log_lines:
+            return
         self.log_text.config(state=tk.NORMAL)  # Enable writing
-        self.log_text.insert(tk.END, f"{timestamp} - {message}\n")
+        self.log_text.insert(tk.END, "\n".join(self._pending_log_lines) + "\n")
+        # The text always ends with an empty line after the last newline
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > _LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - _LOG_MAX_LINES + 1}.0")
         self.log_text.see(tk.END)  # Scroll to the end
         self.log_text.config(state=tk.DISABLED)  # Disable writing
+        self._pending_log_lines.clear()
+
+    def set_buttons_state(self, state: str):
+        """Enables or disables the buttons that modify memory."""
+        for button in (self.allocate_button, self.deallocate_button, self.reset_button):
+            button.config(state=state)
 
     def on_reset_memory(self):
         """Handles the Reset Memory button click."""
@@ -575,9 +969,23 @@ class MemoryAllocatorApp:
             "Are you sure you want to reset the memory to its initial state?",
         ):
             self.log_message("Resetting memory...")
-            self.allocator.reset_memory()
-            self.update_display()
-            self.log_message("Memory reset to initial state.")
+            # Block further allocator changes until the reset has finished
+            self.set_buttons_state(tk.DISABLED)
+            self._reset_future = self._executor.submit(self.allocator.reset_memory)
+            self.root.after(50, self._poll_reset)
+
+    def _poll_reset(self):
+        """Checks whether the background reset is done and refreshes once it is."""
+        future = self._reset_future
+        if not future.done():
+            self.root.after(50, self._poll_reset)
+            return
+
+        self._reset_future = None
+        self.set_buttons_state(tk.NORMAL)
+        future.result()  # Re-raise any error from the worker thread
+        self._schedule_refresh()
+        self.log_message("Memory reset to initial state.")
 
     def on_allocate_memory(self):
         """Handles the Allocate Memory button click."""
@@ -637,7 +1045,7 @@ class MemoryAllocatorApp:
                 )
             self.log_message(error_msg)
 
-        self.update_display()
+        self._schedule_refresh()
 
     def on_deallocate_memory(self):
         """Handles the Deallocate Memory button click."""
@@ -665,481 +1073,167 @@ class MemoryAllocatorApp:
                 f"Process ID '{process_id}' not found in allocated memory.",
             )
 
-        self.update_display()
+        self._schedule_refresh()
+
+    def _insert_algo_section(self, text: tk.Text, spec: dict):
+        """Inserts one algorithm's heading and its label/description rows."""
+        text.insert(tk.END, spec["title"] + "\n", "subheading")
+        last_row = len(spec["rows"]) - 1
+        for i, (label, description) in enumerate(spec["rows"]):
+            text.insert(tk.END, label + " ", ("bold", "indent"))
+            # The last row gets paragraph spacing before the next section
+            tags = ("indent", "paragraph") if i == last_row else "indent"
+            text.insert(tk.END, description + "\n", tags)
+
+    def show_info(self, event=None):
+        # Repeated clicks while the window is up only raise it
+        if self._info_open and self._info_window.winfo_exists():
+            self._info_window.lift()
+            return
+        self._info_open = True
+
+        # Reuse the window built on a previous open
+        if self._info_window is not None and self._info_window.winfo_exists():
+            self._info_window.deiconify()
+            self._info_window.lift()
+            self._focus_info_window()
+            return
 
-    def show_info(e=None):
         # Create a new window
         info_window = tk.Toplevel()
+        self._info_window = info_window
+        # Closing only hides the window so the next open skips rebuilding it
+        info_window.protocol("WM_DELETE_WINDOW", self._close_info_window)
         info_window.title("Memory Allocation Algorithms")
+        # Keep the help window above the main window without a modal grab
+        info_window.transient(self.root)
         info_window.geometry("900x600")
         info_window.minsize(600, 400)
 
-        # Create styles
-        style = ttk.Style()
-        style.configure(
-            "Title.TLabel", font=("Arial", 16, "bold"), foreground="#003366", padding=10
-        )
-        style.configure(
-            "Heading.TLabel",
-            font=("Arial", 14, "bold"),
-            foreground="#004080",
-            padding=(5, 10, 5, 5),
-        )
-        style.configure(
-            "Subheading.TLabel",
-            font=("Arial", 12, "bold"),
-            foreground="#0066CC",
-            padding=(5, 8, 5, 3),
-        )
-        style.configure("Normal.TLabel", font=("Arial", 11), padding=(5, 2))
-
         # Main frame with scrollbar
         main_frame = ttk.Frame(info_window)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Create a canvas with scrollbar
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # Create a frame inside the canvas
-        content_frame = ttk.Frame(canvas)
-        canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw")
-
-        # Title
-        title_label = ttk.Label(
-            content_frame, text="Memory Allocation Algorithms", style="Title.TLabel"
-        )
-        title_label.grid(row=0, column=0, sticky="w")
-
-        # Introduction
-        intro_text = (
-            "Memory allocation is a fundamental process in operating systems and programming languages where "
-            "processes or programs are assigned space in memory. Efficient memory allocation is crucial for "
-            "system performance and stability. Various algorithms exist to manage this task, each with its "
-            "own advantages and disadvantages."
-        )
-        intro_label = ttk.Label(
-            content_frame, text=intro_text, style="Normal.TLabel", wraplength=750
-        )
-        intro_label.grid(row=1, column=0, sticky="w", pady=(0, 10))
-
-        # Heading for algorithms section
-        algorithms_heading = ttk.Label(
-            content_frame,
-            text="Common Memory Allocation Algorithms",
-            style="Heading.TLabel",
-        )
-        algorithms_heading.grid(row=2, column=0, sticky="w")
-
-        # 1. First Fit
-        first_fit_heading = ttk.Label(
-            content_frame, text="1. First Fit", style="Subheading.TLabel"
-        )
-        first_fit_heading.grid(row=3, column=0, sticky="w")
-
-        first_fit_frame = ttk.Frame(content_frame)
-        first_fit_frame.grid(row=4, column=0, sticky="w", padx=20)
-
-        first_fit_process = ttk.Label(
-            first_fit_frame, text="Process:", font=("Arial", 11, "bold")
-        )
-        first_fit_process.grid(row=0, column=0, sticky="w")
-        first_fit_process_text = ttk.Label(
-            first_fit_frame,
-            text="Start searching from the beginning of the memory.",
-            style="Normal.TLabel",
-        )
-        first_fit_process_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
-
-        first_fit_action = ttk.Label(
-            first_fit_frame, text="Action:", font=("Arial", 11, "bold")
-        )
-        first_fit_action.grid(row=1, column=0, sticky="w")
-        first_fit_action_text = ttk.Label(
-            first_fit_frame,
-            text="Allocate the requested memory from the first free block encountered that is \n"
-            "equal to or larger than the requested size.",
-            style="Normal.TLabel",
-        )
-        first_fit_action_text.grid(row=1, column=1, sticky="w", padx=(5, 0))
-
-        first_fit_space = ttk.Label(
-            first_fit_frame, text="Remaining Space:", font=("Arial", 11, "bold")
-        )
-        first_fit_space.grid(row=2, column=0, sticky="w")
-        first_fit_space_text = ttk.Label(
-            first_fit_frame,
-            text="If the allocated block is larger than the request, the remaining portion \n"
-            "is left as a new free block.",
-            style="Normal.TLabel",
-        )
-        first_fit_space_text.grid(
-            row=2, column=1, sticky="w", padx=(5, 0), pady=(0, 10)
-        )
-
-        # 2. Next Fit
-        next_fit_heading = ttk.Label(
-            content_frame, text="2. Next Fit", style="Subheading.TLabel"
-        )
-        next_fit_heading.grid(row=5, column=0, sticky="w")
-
-        next_fit_frame = ttk.Frame(content_frame)
-        next_fit_frame.grid(row=6, column=0, sticky="w", padx=20)
-
-        next_fit_process = ttk.Label(
-            next_fit_frame, text="Process:", font=("Arial", 11, "bold")
-        )
-        next_fit_process.grid(row=0, column=0, sticky="w")
-        next_fit_process_text = ttk.Label(
-            next_fit_frame,
-            text="Start searching from the location where the previous allocation search finished.",
-            style="Normal.TLabel",
-        )
-        next_fit_process_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
-
-        next_fit_action = ttk.Label(
-            next_fit_frame, text="Action:", font=("Arial", 11, "bold")
-        )
-        next_fit_action.grid(row=1, column=0, sticky="w")
-        next_fit_action_text = ttk.Label(
-            next_fit_frame,
-            text="Allocate the requested memory from the first free block encountered from that \n"
-            "point onwards that is equal to or larger than the requested size.",
-            style="Normal.TLabel",
-        )
-        next_fit_action_text.grid(row=1, column=1, sticky="w", padx=(5, 0))
-
-        next_fit_space = ttk.Label(
-            next_fit_frame, text="Remaining Space:", font=("Arial", 11, "bold")
-        )
-        next_fit_space.grid(row=2, column=0, sticky="w")
-        next_fit_space_text = ttk.Label(
-            next_fit_frame,
-            text="Similar to First Fit, the remaining space becomes a new free block.",
-            style="Normal.TLabel",
-        )
-        next_fit_space_text.grid(row=2, column=1, sticky="w", padx=(5, 0))
-
-        next_fit_benefit = ttk.Label(
-            next_fit_frame, text="Benefit:", font=("Arial", 11, "bold")
-        )
-        next_fit_benefit.grid(row=3, column=0, sticky="w")
-        next_fit_benefit_text = ttk.Label(
-            next_fit_frame,
-            text="It tends to distribute memory blocks more evenly throughout the memory.",
-            style="Normal.TLabel",
-        )
-        next_fit_benefit_text.grid(
-            row=3, column=1, sticky="w", padx=(5, 0), pady=(0, 10)
-        )
-
-        # 3. Best Fit
-        best_fit_heading = ttk.Label(
-            content_frame, text="3. Best Fit", style="Subheading.TLabel"
+        # Close button (packed first so it keeps its space when the window shrinks)
+        close_button = ttk.Button(
+            main_frame, text="Close", command=self._close_info_window
         )
-        best_fit_heading.grid(row=7, column=0, sticky="w")
-
-        best_fit_frame = ttk.Frame(content_frame)
-        best_fit_frame.grid(row=8, column=0, sticky="w", padx=20)
+        close_button.pack(side=tk.BOTTOM, pady=10)
 
-        best_fit_process = ttk.Label(
-            best_fit_frame, text="Process:", font=("Arial", 11, "bold")
-        )
-        best_fit_process.grid(row=0, column=0, sticky="w")
-        best_fit_process_text = ttk.Label(
-            best_fit_frame,
-            text="Scan the entire list of free blocks.",
-            style="Normal.TLabel",
+        # All static content lives in one Text widget, which also handles scrolling
+        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL)
+        text = tk.Text(
+            main_frame,
+            wrap=tk.WORD,
+            yscrollcommand=scrollbar.set,
+            padx=10,
+            pady=10,
+            relief=tk.FLAT,
+            cursor="arrow",
+            font=("Arial", 11),  # Body text default; tags only override it
         )
-        best_fit_process_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
+        scrollbar.config(command=text.yview)
 
-        best_fit_action = ttk.Label(
-            best_fit_frame, text="Action:", font=("Arial", 11, "bold")
-        )
-        best_fit_action.grid(row=1, column=0, sticky="w")
-        best_fit_action_text = ttk.Label(
-            best_fit_frame,
-            text="Allocate the requested memory from the free block that is the smallest \n"
-            "among all blocks that can satisfy the request.",
-            style="Normal.TLabel",
-        )
-        best_fit_action_text.grid(row=1, column=1, sticky="w", padx=(5, 0))
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        best_fit_space = ttk.Label(
-            best_fit_frame, text="Remaining Space:", font=("Arial", 11, "bold")
-        )
-        best_fit_space.grid(row=2, column=0, sticky="w")
-        best_fit_space_text = ttk.Label(
-            best_fit_frame,
-            text="The remaining space is left as a new free block.",
-            style="Normal.TLabel",
+        # Text styles
+        text.tag_configure(
+            "title", font=("Arial", 16, "bold"), foreground="#003366", spacing3=10
         )
-        best_fit_space_text.grid(row=2, column=1, sticky="w", padx=(5, 0))
-
-        best_fit_goal = ttk.Label(
-            best_fit_frame, text="Goal:", font=("Arial", 11, "bold")
+        text.tag_configure(
+            "heading",
+            font=("Arial", 14, "bold"),
+            foreground="#004080",
+            spacing1=10,
+            spacing3=5,
         )
-        best_fit_goal.grid(row=3, column=0, sticky="w")
-        best_fit_goal_text = ttk.Label(
-            best_fit_frame,
-            text="To minimize the wasted space (internal fragmentation) within the allocated block.",
-            style="Normal.TLabel",
+        text.tag_configure(
+            "subheading",
+            font=("Arial", 12, "bold"),
+            foreground="#0066CC",
+            spacing1=8,
+            spacing3=3,
         )
-        best_fit_goal_text.grid(row=3, column=1, sticky="w", padx=(5, 0), pady=(0, 10))
+        text.tag_configure("bold", font=self._bold11)
+        text.tag_configure("indent", lmargin1=20, lmargin2=20)
+        text.tag_configure("indent2", lmargin1=40, lmargin2=40)
+        text.tag_configure("paragraph", spacing3=10)
 
-        # 4. Worst Fit
-        worst_fit_heading = ttk.Label(
-            content_frame, text="4. Worst Fit", style="Subheading.TLabel"
-        )
-        worst_fit_heading.grid(row=9, column=0, sticky="w")
+        # Title
+        text.insert(tk.END, "Memory Allocation Algorithms\n", "title")
 
-        worst_fit_frame = ttk.Frame(content_frame)
-        worst_fit_frame.grid(row=10, column=0, sticky="w", padx=20)
+        # Introduction
+        text.insert(tk.END, _HELP_INTRO + "\n", "paragraph")
 
-        worst_fit_process = ttk.Label(
-            worst_fit_frame, text="Process:", font=("Arial", 11, "bold")
-        )
-        worst_fit_process.grid(row=0, column=0, sticky="w")
-        worst_fit_process_text = ttk.Label(
-            worst_fit_frame,
-            text="Scan the entire list of free blocks.",
-            style="Normal.TLabel",
-        )
-        worst_fit_process_text.grid(row=0, column=1, sticky="w", padx=(5, 0))
+        # Heading for algorithms section
+        text.insert(tk.END, "Common Memory Allocation Algorithms\n", "heading")
 
-        worst_fit_action = ttk.Label(
-            worst_fit_frame, text="Action:", font=("Arial", 11, "bold")
-        )
-        worst_fit_action.grid(row=1, column=0, sticky="w")
-        worst_fit_action_text = ttk.Label(
-            worst_fit_frame,
-            text="Allocate the requested memory from the free block that is the largest \n"
-            "among all blocks that can satisfy the request.",
-            style="Normal.TLabel",
-        )
-        worst_fit_action_text.grid(row=1, column=1, sticky="w", padx=(5, 0))
+        # Show the window now; the rest of the content streams in on idle
+        self._focus_info_window()
+        info_window.after_idle(self._build_info_sections, text, 0)
 
-        worst_fit_space = ttk.Label(
-            worst_fit_frame, text="Remaining Space:", font=("Arial", 11, "bold")
-        )
-        worst_fit_space.grid(row=2, column=0, sticky="w")
-        worst_fit_space_text = ttk.Label(
-            worst_fit_frame,
-            text="The remaining space is left as a new free block.",
-            style="Normal.TLabel",
-        )
-        worst_fit_space_text.grid(row=2, column=1, sticky="w", padx=(5, 0))
+    def _build_info_sections(self, text: tk.Text, index: int):
+        """Inserts one algorithm section per idle callback, then the closing text."""
+        if not text.winfo_exists():
+            return
+        if index < len(_ALGORITHM_SECTIONS):
+            self._insert_algo_section(text, _ALGORITHM_SECTIONS[index])
+            text.after_idle(self._build_info_sections, text, index + 1)
+            return
 
-        worst_fit_goal = ttk.Label(
-            worst_fit_frame, text="Goal:", font=("Arial", 11, "bold")
-        )
-        worst_fit_goal.grid(row=3, column=0, sticky="w")
-        worst_fit_goal_text = ttk.Label(
-            worst_fit_frame,
-            text="To leave the largest possible remaining free block, hoping it will be useful \n"
-            "for future larger requests.",
-            style="Normal.TLabel",
-        )
-        worst_fit_goal_text.grid(row=3, column=1, sticky="w", padx=(5, 0), pady=(0, 10))
+        self._insert_justification(text)
+        # Read-only from here on
+        text.config(state=tk.DISABLED)
 
+    def _insert_justification(self, text: tk.Text):
+        """Inserts the First Fit justification that closes the info window."""
         # Justification for First Fit
-        justification_heading = ttk.Label(
-            content_frame, text="Justification for First Fit", style="Heading.TLabel"
-        )
-        justification_heading.grid(row=11, column=0, sticky="w")
+        text.insert(tk.END, "Justification for First Fit\n", "heading")
 
-        justification_text = (
-            "While different algorithms have their merits, First Fit is often considered a practical and "
-            "efficient choice for memory allocation due to several factors:"
-        )
-        justification_intro = ttk.Label(
-            content_frame,
-            text=justification_text,
-            style="Normal.TLabel",
-            wraplength=750,
-        )
-        justification_intro.grid(row=12, column=0, sticky="w", pady=(0, 10))
+        text.insert(tk.END, _HELP_JUSTIFICATION + "\n", "paragraph")
 
         # Memory Blocks and Sizes
-        blocks_heading = ttk.Label(
-            content_frame, text="Memory Blocks and Sizes", style="Subheading.TLabel"
-        )
-        blocks_heading.grid(row=13, column=0, sticky="w")
+        text.insert(tk.END, "Memory Blocks and Sizes\n", "subheading")
 
-        blocks_example_text = (
-            "Consider a scenario with the following memory blocks of varying sizes:"
-        )
-        blocks_example = ttk.Label(
-            content_frame,
-            text=blocks_example_text,
-            style="Normal.TLabel",
-            wraplength=750,
-        )
-        blocks_example.grid(row=14, column=0, sticky="w", padx=20)
-
-        # Create a frame for memory blocks bullet points
-        blocks_frame = ttk.Frame(content_frame)
-        blocks_frame.grid(row=15, column=0, sticky="w", padx=40)
-
-        blocks = [
-            "Block 1: 100 KB",
-            "Block 2: 500 KB",
-            "Block 3: 200 KB",
-            "Block 4: 300 KB",
-            "Block 5: 600 KB",
-        ]
+        text.insert(tk.END, _HELP_BLOCKS_EXAMPLE + "\n", "indent")
 
-        for i, block in enumerate(blocks):
-            block_label = ttk.Label(
-                blocks_frame, text="\u2022 " + block, style="Normal.TLabel"
-            )
-            block_label.grid(row=i, column=0, sticky="w")
-
-        comparison_text = (
-            "Let's say we have a request for 250 KB.\n\n"
-            "First Fit: It would scan from Block 1. Block 1 (100 KB) is too small. Block 2 (500 KB) is large enough. "
-            "First Fit allocates 250 KB from Block 2, leaving a 250 KB free block.\n\n"
-            "Best Fit: It would scan all blocks. Block 2 (500 KB), Block 4 (300 KB), and Block 5 (600 KB) are large enough. "
-            "Best Fit would choose Block 4 (300 KB) as it's the smallest sufficient block, allocating 250 KB and leaving a 50 KB free block.\n\n"
-            "Worst Fit: It would choose Block 5 (600 KB) as it's the largest, allocating 250 KB and leaving a 350 KB free block.\n\n"
-            "In this simple example, First Fit quickly finds a suitable block without scanning the entire memory, which can be faster."
-        )
-        comparison = ttk.Label(
-            content_frame, text=comparison_text, style="Normal.TLabel", wraplength=750
-        )
-        comparison.grid(row=16, column=0, sticky="w", padx=20, pady=(5, 10))
+        # One insert for the whole bullet list
+        text.insert(tk.END, _HELP_BLOCK_BULLETS, "indent2")
 
-        # Allocation and Deallocation Requests
-        alloc_heading = ttk.Label(
-            content_frame,
-            text="Allocation and Deallocation Requests",
-            style="Subheading.TLabel",
-        )
-        alloc_heading.grid(row=17, column=0, sticky="w")
-
-        alloc_text = (
-            "Simulating a series of allocation and deallocation requests highlights First Fit's efficiency. "
-            "First Fit's speed comes from its straightforward approach: it stops searching as soon as a suitable "
-            "block is found. This is particularly beneficial when the memory has many free blocks at the beginning. "
-            "While Best Fit and Worst Fit need to scan more or all of the free list, First Fit's search time is, "
-            "on average, less.\n\n"
-            "Deallocation in First Fit is also relatively simple; the deallocated block is typically merged with "
-            "adjacent free blocks if they exist."
-        )
-        alloc_label = ttk.Label(
-            content_frame, text=alloc_text, style="Normal.TLabel", wraplength=750
-        )
-        alloc_label.grid(row=18, column=0, sticky="w", padx=20, pady=(0, 10))
+        text.insert(tk.END, _HELP_COMPARISON + "\n", ("indent", "paragraph"))
 
-        # Fragmentation
-        frag_heading = ttk.Label(
-            content_frame, text="Fragmentation", style="Subheading.TLabel"
-        )
-        frag_heading.grid(row=19, column=0, sticky="w")
+        # Allocation and Deallocation Requests
+        text.insert(tk.END, "Allocation and Deallocation Requests\n", "subheading")
 
-        frag_text = "Fragmentation is a key issue in memory allocation."
-        frag_intro = ttk.Label(
-            content_frame, text=frag_text, style="Normal.TLabel", wraplength=750
-        )
-        frag_intro.grid(row=20, column=0, sticky="w", padx=20)
+        text.insert(tk.END, _HELP_ALLOC + "\n", ("indent", "paragraph"))
 
-        internal_frag_label = ttk.Label(
-            content_frame, text="Internal Fragmentation:", font=("Arial", 11, "bold")
-        )
-        internal_frag_label.grid(row=21, column=0, sticky="w", padx=40)
-        internal_frag_text = (
-            "Occurs when the allocated memory block is larger than the requested size, and the excess "
-            "space within the block cannot be used by other processes. Best Fit aims to minimize this, "
-            "but First Fit can also result in internal fragmentation when a larger block is used for a smaller request."
-        )
-        internal_frag = ttk.Label(
-            content_frame,
-            text=internal_frag_text,
-            style="Normal.TLabel",
-            wraplength=730,
-        )
-        internal_frag.grid(row=22, column=0, sticky="w", padx=40)
-
-        external_frag_label = ttk.Label(
-            content_frame, text="External Fragmentation:", font=("Arial", 11, "bold")
-        )
-        external_frag_label.grid(row=23, column=0, sticky="w", padx=40, pady=(10, 0))
-        external_frag_text = (
-            "Occurs when there is enough total free space to satisfy a request, but the free space is "
-            "scattered in small, non-contiguous blocks. All simple contiguous allocation algorithms like "
-            "First Fit, Best Fit, and Worst Fit are susceptible to external fragmentation over time."
-        )
-        external_frag = ttk.Label(
-            content_frame,
-            text=external_frag_text,
-            style="Normal.TLabel",
-            wraplength=730,
-        )
-        external_frag.grid(row=24, column=0, sticky="w", padx=40)
-
-        frag_summary_text = (
-            "First Fit's handling of fragmentation is a trade-off. While it might lead to more external "
-            "fragmentation over time compared to Best Fit (as it tends to use up smaller blocks at the beginning, "
-            "leaving larger blocks fragmented later), its speed often compensates for this in many practical "
-            "scenarios. The tendency of First Fit to use blocks at the beginning can also lead to larger free "
-            "blocks accumulating towards the end of memory, which can be beneficial for larger future requests."
-        )
-        frag_summary = ttk.Label(
-            content_frame, text=frag_summary_text, style="Normal.TLabel", wraplength=750
-        )
-        frag_summary.grid(row=25, column=0, sticky="w", padx=20, pady=(10, 10))
+        # Fragmentation
+        text.insert(tk.END, "Fragmentation\n", "subheading")
 
-        # Justification Summary
-        summary_heading = ttk.Label(
-            content_frame, text="Justification Summary", style="Subheading.TLabel"
-        )
-        summary_heading.grid(row=26, column=0, sticky="w")
-
-        summary_text = (
-            "First Fit is often preferred in practice due to its speed of allocation. It requires less overhead "
-            "for searching compared to Best Fit and Worst Fit, which must scan more or all of the free list. "
-            "While it may not be optimal in terms of minimizing internal fragmentation or preventing external "
-            "fragmentation entirely, its simplicity and speed make it a good general-purpose algorithm, "
-            'especially in systems where allocation speed is critical. The overhead of searching for the "best" '
-            'or "worst" fit can outweigh the potential benefits in terms of fragmentation in many real-world scenarios.'
-        )
-        summary_label = ttk.Label(
-            content_frame, text=summary_text, style="Normal.TLabel", wraplength=750
-        )
-        summary_label.grid(row=27, column=0, sticky="w", padx=20, pady=(0, 20))
+        text.insert(tk.END, _HELP_FRAG_INTRO + "\n", "indent")
 
-        # Close button
-        close_button = ttk.Button(
-            content_frame, text="Close", command=info_window.destroy
-        )
-        close_button.grid(row=28, column=0, pady=10)
+        text.insert(tk.END, "Internal Fragmentation: ", ("bold", "indent2"))
+        text.insert(tk.END, _HELP_FRAG_INT + "\n", ("indent2", "paragraph"))
 
-        # Update the scrollregion after the window size is updated
-        def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Set the width of the canvas window to fill the available space
-            canvas.itemconfig(canvas_window, width=canvas.winfo_width())
+        text.insert(tk.END, "External Fragmentation: ", ("bold", "indent2"))
+        text.insert(tk.END, _HELP_FRAG_EXT + "\n", ("indent2", "paragraph"))
 
-        canvas.bind("<Configure>", configure_scroll_region)
-        content_frame.bind("<Configure>", configure_scroll_region)
+        text.insert(tk.END, _HELP_FRAG_SUMMARY + "\n", ("indent", "paragraph"))
 
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # Justification Summary
+        text.insert(tk.END, "Justification Summary\n", "subheading")
 
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        text.insert(tk.END, _HELP_SUMMARY, "indent")
 
-            # Focus on the info window
-            info_window.focus_set()
-            info_window.grab_set()  # Make window modal
+    def _focus_info_window(self):
+        """Focuses the info window; done once per open."""
+        self._info_window.focus_set()
 
-            # Wait for window to appear before configuring the scroll region
-            info_window.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+    def _close_info_window(self):
+        """Hides the info window for reuse."""
+        self._info_open = False
+        self._info_window.withdraw()
 
     def show_about(e):
         messagebox.showinfo(